@@ -2,15 +2,16 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-import aiohttp
-import async_timeout
 import re
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -20,11 +21,84 @@ from .const import (
     CONF_SCROLL_INTERVAL,
     CONF_API_KEY,
     DEFAULT_SCROLL_INTERVAL,
+    CONF_PROXY,
+    CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    CONF_FEEDS,
+    MAX_CONCURRENT_FEEDS,
+    FEED_TIMEOUT_MARGIN,
+    FEED_RETRY_INTERVAL,
+    SERVICE_PROFILE,
+    ATTR_DURATION,
+    DEFAULT_PROFILE_DURATION,
+    DATA_PROFILER,
+    DEDUP_SAVE_DELAY,
+    STORAGE_VERSION,
+    STORAGE_KEY_TEMPLATE,
     PLATFORMS,
 )
+from .client import DailyNewsHttpClient, create_http_client
+from .dedup import HeadlineIndex
+from .feeds import FEEDS, FeedError, parse_feed_items
+from .profiler import DailyNewsProfiler
+from .sensor import DailyNewsSensor, ScrollingNewsSensor
 
 _LOGGER = logging.getLogger(__name__)
 
+def _get_entry_value(entry: ConfigEntry, key: str, default):
+    """从选项或数据中读取配置值，选项优先."""
+    if entry.options and key in entry.options:
+        return entry.options[key]
+    if entry.data and key in entry.data:
+        return entry.data[key]
+    return default
+
+def _create_entry_client(hass: HomeAssistant, entry: ConfigEntry) -> DailyNewsHttpClient:
+    """根据配置条目创建HTTP客户端."""
+    return create_http_client(
+        hass,
+        proxy=_get_entry_value(entry, CONF_PROXY, ""),
+        connect_timeout=_get_entry_value(entry, CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        read_timeout=_get_entry_value(entry, CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+    )
+
+def get_feeds(entry: ConfigEntry) -> list:
+    """读取已启用的附加数据源，忽略未知的数据源."""
+    feeds = _get_entry_value(entry, CONF_FEEDS, []) or []
+    return [feed_id for feed_id in feeds if feed_id in FEEDS]
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+        vol.Coerce(int), vol.Range(min=5, max=3600)
+    ),
+})
+
+def _async_register_services(hass: HomeAssistant):
+    """注册性能分析服务."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        return
+
+    async def async_handle_profile(call: ServiceCall):
+        """在指定时长内统计协调器和传感器的耗时."""
+        profiler = hass.data.get(DATA_PROFILER)
+        if profiler and profiler.running:
+            _LOGGER.warning("性能分析正在进行中，请等待结束后再试")
+            return
+
+        profiler = DailyNewsProfiler(
+            hass,
+            hass.data[DOMAIN].values(),
+            (DailyNewsSensor, ScrollingNewsSensor),
+        )
+        hass.data[DATA_PROFILER] = profiler
+        profiler.async_start(call.data[ATTR_DURATION])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_handle_profile, schema=PROFILE_SCHEMA
+    )
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Daily News from a config entry."""
     
@@ -58,11 +132,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except (ValueError, TypeError, KeyError):
         scroll_interval = DEFAULT_SCROLL_INTERVAL
     
-    coordinator = DailyNewsDataCoordinator(hass, entry, api_key, scroll_interval)
+    client = _create_entry_client(hass, entry)
+    coordinator = DailyNewsDataCoordinator(
+        hass, entry, api_key, scroll_interval, client, get_feeds(entry)
+    )
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
+    # HTTP会话随配置条目卸载或Home Assistant关闭时释放
+    async def async_close_client(_event: Event | None = None):
+        await coordinator.client.async_close()
+    
+    entry.async_on_unload(async_close_client)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_client)
+    )
+    
+    try:
+        await _async_setup_coordinator(hass, entry, coordinator)
+    except Exception:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await coordinator.client.async_close()
+        raise
+    
+    _async_register_services(hass)
+    
+    return True
+
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: "DailyNewsDataCoordinator"
+):
+    """创建设备、加载数据并启动后台任务."""
     # 创建设备
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
@@ -74,6 +175,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sw_version=entry.version,
     )
     
+    # 加载最近几天的新闻索引
+    await coordinator.async_load_headline_index()
+    
     # 立即进行第一次数据更新
     try:
         await coordinator.async_config_entry_first_refresh()
@@ -87,8 +191,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # 启动滚动任务
     coordinator.start_scrolling()
-    
-    return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
@@ -96,19 +198,51 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator.stop_scheduled_updates()
     coordinator.stop_scrolling()
     
+    # 卸载前结束正在进行的性能分析，恢复被替换的函数
+    profiler = hass.data.pop(DATA_PROFILER, None)
+    if profiler:
+        await profiler.async_stop()
+    
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
 
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is removed."""
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY_TEMPLATE.format(entry.entry_id)).async_remove()
+
 
 class DailyNewsDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Daily News data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api_key: str, scroll_interval: int):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api_key: str,
+        scroll_interval: int,
+        client: DailyNewsHttpClient,
+        feeds: list,
+    ):
         """Initialize."""
         self.entry = entry
+        self.client = client
+        self.feeds = feeds
+        self.feed_cache = {}
+        self.feed_state = {}
+        self.primary_data = None
+        self.feed_task = None
+        self._refresh_lock = asyncio.Lock()
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+        self.headline_index = HeadlineIndex()
+        self.headline_store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_TEMPLATE.format(entry.entry_id)
+        )
         self.api_key = api_key
         self.scroll_interval = scroll_interval
         self.scroll_task = None
@@ -140,6 +274,8 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
             "weiyu": "暂无微语",
             "news": {},
             "total_news": 0,
+            "new_news": {},
+            "new_news_count": 0,
             "scroll_interval": self.scroll_interval,
             "last_update": "从未更新",
             "update_schedule": "每日7点开始更新",
@@ -147,6 +283,127 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
         }
 
     async def _async_update_data(self):
+        """并发获取主数据源和附加数据源，合并为一个快照."""
+        # 持锁期间当前客户端不会被关闭
+        async with self._refresh_lock:
+            return await self._async_fetch_all()
+
+    async def _async_fetch_all(self):
+        """获取并合并所有数据源."""
+        primary, _ = await asyncio.gather(
+            self._async_run_limited(self._async_fetch_primary()),
+            self._async_fetch_feeds(list(self.feeds)),
+            return_exceptions=True,
+        )
+
+        if isinstance(primary, BaseException):
+            _LOGGER.warning("API更新失败: %s", primary)
+            err = primary
+            primary = self._get_default_data()
+            primary["status"] = self._describe_error(err)
+            primary["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            primary["update_schedule"] = "更新失败，15分钟后重试"
+
+        self.primary_data = primary
+        return self._build_snapshot()
+
+    async def _async_run_limited(self, coro):
+        """限制并发数，每个数据源单独计算超时（由客户端的连接和读取超时推算）."""
+        async with self._fetch_semaphore:
+            timeout = self.client.connect_timeout + self.client.read_timeout + FEED_TIMEOUT_MARGIN
+            return await asyncio.wait_for(coro, timeout)
+
+    async def _async_fetch_feed(self, feed_id):
+        """获取单个附加数据源的条目."""
+        status, payload = await self.client.async_get_json(FEEDS[feed_id]["url"])
+        if status != 200:
+            raise FeedError(f"请求失败({status})")
+        return parse_feed_items(payload)
+
+    async def _async_fetch_feeds(self, feed_ids):
+        """并发获取附加数据源，并按数据源记录结果，失败的数据源沿用上次结果."""
+        results = await asyncio.gather(
+            *(self._async_run_limited(self._async_fetch_feed(feed_id)) for feed_id in feed_ids),
+            return_exceptions=True,
+        )
+
+        now = dt_util.utcnow()
+        for feed_id, result in zip(feed_ids, results):
+            state = self.feed_state.setdefault(feed_id, {"success": False, "last_success": None})
+            if isinstance(result, BaseException):
+                _LOGGER.warning("数据源%s更新失败: %s", FEEDS[feed_id]["name"], result)
+                state["success"] = False
+                state["status"] = self._describe_error(result)
+                if self.feed_cache.get(feed_id):
+                    state["status"] = f"{state['status']}，沿用上次数据"
+            else:
+                self.feed_cache[feed_id] = result
+                state["success"] = True
+                state["last_success"] = now
+                state["status"] = "更新成功"
+
+    def _feeds_due(self):
+        """返回需要更新的附加数据源：上次失败的，或已超过各自更新间隔的."""
+        now = dt_util.utcnow()
+        due = []
+        for feed_id in self.feeds:
+            state = self.feed_state.get(feed_id)
+            if (
+                state is None
+                or not state["success"]
+                or now - state["last_success"] >= timedelta(seconds=FEEDS[feed_id]["scan_interval"])
+            ):
+                due.append(feed_id)
+        return due
+
+    @staticmethod
+    def _describe_error(err):
+        """生成简短的错误描述."""
+        if isinstance(err, asyncio.TimeoutError):
+            return "请求超时"
+        return f"更新失败: {str(err)[:50]}"
+
+    def _build_snapshot(self):
+        """将附加数据源的条目追加到主数据源之后，生成新的快照."""
+        data = dict(self.primary_data)
+        data["scroll_interval"] = self.scroll_interval
+        news = dict(data.get("news", {}))
+        total_news = len(news)
+        feeds = {
+            "60s": {
+                "name": "每日新闻",
+                "status": data.get("status", ""),
+                "total": total_news,
+            }
+        }
+
+        for feed_id in self.feeds:
+            name = FEEDS[feed_id]["name"]
+            items = self.feed_cache.get(feed_id, [])
+            state = self.feed_state.get(feed_id, {})
+
+            for index, text in enumerate(items, 1):
+                total_news += 1
+                news[f"news_{total_news}"] = f"【{name}】{index}. {text}"
+
+            last_success = state.get("last_success")
+            feeds[feed_id] = {
+                "name": name,
+                "status": state.get("status", "等待更新"),
+                "total": len(items),
+                "last_update": (
+                    dt_util.as_local(last_success).strftime("%Y-%m-%d %H:%M:%S")
+                    if last_success
+                    else "从未更新"
+                ),
+            }
+
+        data["news"] = news
+        data["total_news"] = total_news
+        data["feeds"] = feeds
+        return data
+
+    async def _async_fetch_primary(self):
         """Fetch data from API."""
         # 检查API Key是否已配置
         if not self.api_key or self.api_key.strip() == "":
@@ -162,54 +419,45 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
         self._check_reset_daily_counters()
         
         try:
-            session = async_get_clientsession(self.hass)
-            
-            # 添加User-Agent头
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
             api_url = self._get_api_url()
             _LOGGER.debug("请求API URL: %s", api_url.replace(self.api_key, "***"))  # 隐藏API Key
             
-            async with async_timeout.timeout(15):
-                response = await session.get(api_url, headers=headers)
-                
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # 检查API返回的success字段
-                    if data.get("success", False):
-                        processed_data = self._process_data(data)
-                        processed_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        processed_data["update_schedule"] = "更新成功"
-                        processed_data["api_key_status"] = "有效"
-                        self.today_success = True
-                        _LOGGER.info("API更新成功")
-                        return processed_data
-                    else:
-                        _LOGGER.warning("API返回失败状态: %s", data)
-                        default_data = self._get_default_data()
-                        default_data["status"] = "API返回失败，请检查API Key"
-                        default_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        default_data["update_schedule"] = "更新失败，15分钟后重试"
-                        default_data["api_key_status"] = "可能无效"
-                        return default_data
-                elif response.status == 401 or response.status == 403:
-                    _LOGGER.error("API认证失败，状态码: %s，请检查API Key", response.status)
-                    default_data = self._get_default_data()
-                    default_data["status"] = f"API认证失败({response.status})，请检查API Key"
-                    default_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    default_data["update_schedule"] = "认证失败，请检查API Key"
-                    default_data["api_key_status"] = "无效"
-                    return default_data
+            # 连接/读取超时由HTTP客户端控制
+            status, data = await self.client.async_get_json(api_url)
+            
+            if status == 200:
+                # 检查API返回的success字段
+                if data.get("success", False):
+                    processed_data = self._process_data(data)
+                    processed_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    processed_data["update_schedule"] = "更新成功"
+                    processed_data["api_key_status"] = "有效"
+                    self.today_success = True
+                    _LOGGER.info("API更新成功")
+                    return processed_data
                 else:
-                    _LOGGER.warning("API请求失败，状态码: %s", response.status)
+                    _LOGGER.warning("API返回失败状态: %s", data)
                     default_data = self._get_default_data()
-                    default_data["status"] = f"API请求失败({response.status})"
+                    default_data["status"] = "API返回失败，请检查API Key"
                     default_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     default_data["update_schedule"] = "更新失败，15分钟后重试"
+                    default_data["api_key_status"] = "可能无效"
                     return default_data
+            elif status == 401 or status == 403:
+                _LOGGER.error("API认证失败，状态码: %s，请检查API Key", status)
+                default_data = self._get_default_data()
+                default_data["status"] = f"API认证失败({status})，请检查API Key"
+                default_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                default_data["update_schedule"] = "认证失败，请检查API Key"
+                default_data["api_key_status"] = "无效"
+                return default_data
+            else:
+                _LOGGER.warning("API请求失败，状态码: %s", status)
+                default_data = self._get_default_data()
+                default_data["status"] = f"API请求失败({status})"
+                default_data["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                default_data["update_schedule"] = "更新失败，15分钟后重试"
+                return default_data
                     
         except asyncio.TimeoutError:
             _LOGGER.warning("API请求超时")
@@ -226,6 +474,13 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
             default_data["update_schedule"] = "更新失败，15分钟后重试"
             return default_data
 
+    async def async_load_headline_index(self):
+        """从存储中加载最近几天的新闻索引."""
+        try:
+            self.headline_index.load(await self.headline_store.async_load())
+        except Exception as err:
+            _LOGGER.warning("加载新闻索引失败: %s", err)
+
     def _check_reset_daily_counters(self):
         """检查并重置每日计数器."""
         today = datetime.now().strftime("%Y-%m-%d")
@@ -258,10 +513,20 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
         if weiyu and weiyu != "暂无微语":
             weiyu = f"【微语】{weiyu}"
         
-        # 处理新闻列表，添加序号
+        # 处理新闻列表，添加序号，并标记最近几天未出现过的新闻
         news_object = {}
+        new_news = {}
+        headlines = []
         for index, item in enumerate(news_list, 1):
-            news_object[f"news_{index}"] = format_news_content(str(item), index)
+            key = f"news_{index}"
+            news_object[key] = format_news_content(str(item), index)
+            headlines.append(str(item))
+            if str(item).strip() and not self.headline_index.is_duplicate(str(item), date):
+                new_news[key] = news_object[key]
+        
+        # 更新并延迟保存索引
+        self.headline_index.set_day(date, headlines)
+        self.headline_store.async_delay_save(self.headline_index.as_dict, DEDUP_SAVE_DELAY)
         
         return {
             "title": "每日新闻",
@@ -272,6 +537,8 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
             "weiyu": weiyu,
             "news": news_object,
             "total_news": len(news_list),
+            "new_news": new_news,
+            "new_news_count": len(new_news),
             "scroll_interval": self.scroll_interval,
             "api_key_status": "有效"
         }
@@ -280,12 +547,36 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
         """启动定时更新任务 - 每天6点开始，失败则15分钟重试."""
         self.stop_scheduled_updates()
         self.update_task = self.hass.loop.create_task(self._scheduled_updates())
+        self.feed_task = self.hass.loop.create_task(self._scheduled_feed_updates())
 
     def stop_scheduled_updates(self):
         """停止定时更新任务."""
         if self.update_task:
             self.update_task.cancel()
             self.update_task = None
+        if self.feed_task:
+            self.feed_task.cancel()
+            self.feed_task = None
+
+    async def _scheduled_feed_updates(self):
+        """附加数据源独立更新：按各自间隔刷新，失败的数据源定期重试."""
+        while True:
+            await asyncio.sleep(FEED_RETRY_INTERVAL)
+            
+            # 主数据源尚未完成首次更新时跳过
+            if self.primary_data is None:
+                continue
+            
+            due = self._feeds_due()
+            if not due:
+                continue
+            
+            try:
+                async with self._refresh_lock:
+                    await self._async_fetch_feeds(due)
+                self.async_set_updated_data(self._build_snapshot())
+            except Exception as err:
+                _LOGGER.warning("附加数据源更新失败: %s", err)
 
     async def _scheduled_updates(self):
         """处理定时更新 - 每天7点开始，失败则15分钟重试."""
@@ -345,14 +636,17 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
         """滚动显示新闻."""
         while True:
             await asyncio.sleep(self.scroll_interval)
+            self._scroll_next()
+
+    def _scroll_next(self):
+        """切换到下一条新闻."""
+        if self.data and "news" in self.data:
+            news_count = self.data.get("total_news", 0)
             
-            if self.data and "news" in self.data:
-                news_count = self.data.get("total_news", 0)
-                
-                if news_count > 0:
-                    self.current_news_index = (self.current_news_index % news_count) + 1
-                    # 通知传感器更新
-                    self.async_set_updated_data(self.data)
+            if news_count > 0:
+                self.current_news_index = (self.current_news_index % news_count) + 1
+                # 通知传感器更新
+                self.async_set_updated_data(self.data)
 
     def get_current_news(self):
         """获取当前滚动新闻."""
@@ -408,4 +702,46 @@ class DailyNewsDataCoordinator(DataUpdateCoordinator):
             # 强制立即更新数据
             self.hass.loop.create_task(self.async_refresh())
         else:
-            _LOGGER.error("API Key不能为空")
\ No newline at end of file
+            _LOGGER.error("API Key不能为空")
+
+    def update_feeds(self, new_feeds: list):
+        """更新启用的附加数据源."""
+        new_feeds = [feed_id for feed_id in new_feeds if feed_id in FEEDS]
+        if new_feeds == self.feeds:
+            return
+
+        self.feeds = new_feeds
+        # 移除已停用数据源的缓存和状态
+        self.feed_cache = {
+            feed_id: items
+            for feed_id, items in self.feed_cache.items()
+            if feed_id in new_feeds
+        }
+        self.feed_state = {
+            feed_id: state
+            for feed_id, state in self.feed_state.items()
+            if feed_id in new_feeds
+        }
+        _LOGGER.info("附加数据源更新为: %s", new_feeds)
+        self.hass.loop.create_task(self.async_refresh())
+
+    def update_client_options(self, proxy: str, connect_timeout: int, read_timeout: int):
+        """代理或超时配置变更时替换HTTP客户端，未变更则保留现有连接池."""
+        new_client = create_http_client(
+            self.hass,
+            proxy=proxy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+        if new_client.settings == self.client.settings:
+            return
+        
+        old_client = self.client
+        self.client = new_client
+        self.hass.async_create_task(self._async_close_client_after_refresh(old_client))
+        _LOGGER.info("HTTP客户端配置已更新")
+
+    async def _async_close_client_after_refresh(self, client: DailyNewsHttpClient):
+        """等待正在进行的更新结束后再关闭旧客户端."""
+        async with self._refresh_lock:
+            await client.async_close()
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""HTTP client for Daily News integration."""
+import logging
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT,
+    USER_AGENT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DailyNewsHttpClient:
+    """集成专用的HTTP客户端（连接复用、DNS缓存、代理）."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        proxy: str = "",
+        connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: int = DEFAULT_READ_TIMEOUT,
+    ):
+        """Initialize."""
+        self.hass = hass
+        self.proxy = proxy.strip() if proxy else None
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._session = None
+
+    @property
+    def settings(self):
+        """返回影响会话的配置，用于判断是否需要重建客户端."""
+        return (self.proxy, self.connect_timeout, self.read_timeout)
+
+    def _get_session(self):
+        """获取（必要时创建）共享会话，所有请求复用同一个连接池."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=self.connect_timeout + self.read_timeout,
+                connect=self.connect_timeout,
+                sock_read=self.read_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"User-Agent": USER_AGENT},
+            )
+            _LOGGER.debug(
+                "创建HTTP会话，代理: %s，连接超时: %s秒，读取超时: %s秒",
+                "已配置" if self.proxy else "未配置",
+                self.connect_timeout,
+                self.read_timeout,
+            )
+        return self._session
+
+    async def async_get_json(self, url: str):
+        """请求URL并返回(状态码, JSON数据)，非200时数据为None."""
+        session = self._get_session()
+        async with session.get(url, proxy=self.proxy) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.json()
+
+    async def async_close(self):
+        """关闭会话并释放连接池."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def _clamp_timeout(value, default: int) -> int:
+    """将超时配置限制在1-60秒之间."""
+    try:
+        value = int(value)
+    except (ValueError, TypeError):
+        return default
+    return min(max(value, 1), 60)
+
+
+def create_http_client(
+    hass: HomeAssistant,
+    proxy: str = "",
+    connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: int = DEFAULT_READ_TIMEOUT,
+) -> DailyNewsHttpClient:
+    """创建HTTP客户端（会话在首次请求时才建立）."""
+    return DailyNewsHttpClient(
+        hass,
+        proxy=proxy or "",
+        connect_timeout=_clamp_timeout(connect_timeout, DEFAULT_CONNECT_TIMEOUT),
+        read_timeout=_clamp_timeout(read_timeout, DEFAULT_READ_TIMEOUT),
+    )
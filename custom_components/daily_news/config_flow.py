@@ -3,16 +3,48 @@ import logging
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
 from .const import (
     DOMAIN, 
     DEFAULT_NAME, 
     CONF_SCROLL_INTERVAL, 
     CONF_API_KEY,
-    DEFAULT_SCROLL_INTERVAL
+    CONF_PROXY,
+    CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    DEFAULT_SCROLL_INTERVAL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    CONF_FEEDS,
 )
+from .feeds import FEEDS
 
 _LOGGER = logging.getLogger(__name__)
 
+
+FEED_OPTIONS = {feed_id: feed["name"] for feed_id, feed in FEEDS.items()}
+
+
+def _validate_client_input(user_input, errors):
+    """验证代理与超时配置，返回(代理, 连接超时, 读取超时)."""
+    proxy = (user_input.get(CONF_PROXY) or "").strip()
+    if proxy and not proxy.startswith(("http://", "https://")):
+        errors[CONF_PROXY] = "invalid_proxy"
+    
+    timeouts = {}
+    for key, default in (
+        (CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        (CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+    ):
+        try:
+            timeouts[key] = int(user_input.get(key, default))
+            if timeouts[key] < 1 or timeouts[key] > 60:
+                errors[key] = "timeout_range"
+        except (ValueError, TypeError):
+            errors[key] = "invalid_timeout"
+    
+    return proxy, timeouts.get(CONF_CONNECT_TIMEOUT), timeouts.get(CONF_READ_TIMEOUT)
+
 class DailyNewsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Daily News."""
 
@@ -41,13 +73,20 @@ class DailyNewsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 except ValueError:
                     errors[CONF_SCROLL_INTERVAL] = "invalid_scroll_interval"
             
+            # 验证代理与超时
+            proxy, connect_timeout, read_timeout = _validate_client_input(user_input, errors)
+            
             if not errors:
                 # 保存配置
                 return self.async_create_entry(
                     title=DEFAULT_NAME, 
                     data={
                         CONF_API_KEY: api_key.strip(),
-                        CONF_SCROLL_INTERVAL: scroll_interval
+                        CONF_SCROLL_INTERVAL: scroll_interval,
+                        CONF_PROXY: proxy,
+                        CONF_CONNECT_TIMEOUT: connect_timeout,
+                        CONF_READ_TIMEOUT: read_timeout,
+                        CONF_FEEDS: user_input.get(CONF_FEEDS, []),
                     }
                 )
 
@@ -61,7 +100,27 @@ class DailyNewsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_SCROLL_INTERVAL,
                 default=DEFAULT_SCROLL_INTERVAL,
                 description="滚动间隔（秒）"
-            ): int
+            ): int,
+            vol.Optional(
+                CONF_PROXY,
+                default="",
+                description="HTTP代理（可选）"
+            ): str,
+            vol.Required(
+                CONF_CONNECT_TIMEOUT,
+                default=DEFAULT_CONNECT_TIMEOUT,
+                description="连接超时（秒）"
+            ): int,
+            vol.Required(
+                CONF_READ_TIMEOUT,
+                default=DEFAULT_READ_TIMEOUT,
+                description="读取超时（秒）"
+            ): int,
+            vol.Optional(
+                CONF_FEEDS,
+                default=[],
+                description="附加数据源"
+            ): cv.multi_select(FEED_OPTIONS)
         })
 
         return self.async_show_form(
@@ -107,6 +166,9 @@ class DailyNewsOptionsFlow(config_entries.OptionsFlow):
                 except ValueError:
                     errors[CONF_SCROLL_INTERVAL] = "invalid_scroll_interval"
             
+            # 验证代理与超时
+            proxy, connect_timeout, read_timeout = _validate_client_input(user_input, errors)
+            
             if not errors:
                 # 更新协调器中的配置
                 hass = self.hass
@@ -118,13 +180,21 @@ class DailyNewsOptionsFlow(config_entries.OptionsFlow):
                     coordinator.update_api_key(api_key.strip())
                     # 更新滚动间隔
                     coordinator.update_scroll_interval(scroll_interval)
+                    # 更新HTTP客户端（代理与超时）
+                    coordinator.update_client_options(proxy, connect_timeout, read_timeout)
+                    # 更新附加数据源
+                    coordinator.update_feeds(user_input.get(CONF_FEEDS, []))
                 
                 # 保存选项
                 return self.async_create_entry(
                     title="", 
                     data={
                         CONF_API_KEY: api_key.strip(),
-                        CONF_SCROLL_INTERVAL: scroll_interval
+                        CONF_SCROLL_INTERVAL: scroll_interval,
+                        CONF_PROXY: proxy,
+                        CONF_CONNECT_TIMEOUT: connect_timeout,
+                        CONF_READ_TIMEOUT: read_timeout,
+                        CONF_FEEDS: user_input.get(CONF_FEEDS, []),
                     }
                 )
 
@@ -145,6 +215,27 @@ class DailyNewsOptionsFlow(config_entries.OptionsFlow):
             current_scroll_interval = int(current_scroll_interval)
         except (ValueError, TypeError):
             current_scroll_interval = DEFAULT_SCROLL_INTERVAL
+        
+        current_proxy = self.config_entry.options.get(
+            CONF_PROXY,
+            self.config_entry.data.get(CONF_PROXY, "")
+        )
+        current_connect_timeout = self.config_entry.options.get(
+            CONF_CONNECT_TIMEOUT,
+            self.config_entry.data.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)
+        )
+        current_read_timeout = self.config_entry.options.get(
+            CONF_READ_TIMEOUT,
+            self.config_entry.data.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)
+        )
+        current_feeds = [
+            feed_id
+            for feed_id in self.config_entry.options.get(
+                CONF_FEEDS,
+                self.config_entry.data.get(CONF_FEEDS, [])
+            )
+            if feed_id in FEED_OPTIONS
+        ]
 
         # 创建数据模式，API Key在滚动间隔之前
         data_schema = vol.Schema({
@@ -157,7 +248,27 @@ class DailyNewsOptionsFlow(config_entries.OptionsFlow):
                 CONF_SCROLL_INTERVAL,
                 default=current_scroll_interval,
                 description="滚动间隔（秒）"
-            ): int
+            ): int,
+            vol.Optional(
+                CONF_PROXY,
+                default=current_proxy,
+                description="HTTP代理（可选）"
+            ): str,
+            vol.Required(
+                CONF_CONNECT_TIMEOUT,
+                default=current_connect_timeout,
+                description="连接超时（秒）"
+            ): int,
+            vol.Required(
+                CONF_READ_TIMEOUT,
+                default=current_read_timeout,
+                description="读取超时（秒）"
+            ): int,
+            vol.Optional(
+                CONF_FEEDS,
+                default=current_feeds,
+                description="附加数据源"
+            ): cv.multi_select(FEED_OPTIONS)
         })
 
         return self.async_show_form(
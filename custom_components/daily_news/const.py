@@ -7,6 +7,37 @@ DEFAULT_SCROLL_INTERVAL = 15  # 15 seconds
 
 CONF_SCROLL_INTERVAL = "scroll_interval"
 CONF_API_KEY = "api_key"  # 新增API Key配置
+CONF_PROXY = "proxy"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+
+# HTTP客户端配置
+DEFAULT_CONNECT_TIMEOUT = 5  # 5 seconds
+DEFAULT_READ_TIMEOUT = 10  # 10 seconds
+DNS_CACHE_TTL = 300  # 5 minutes
+KEEPALIVE_TIMEOUT = 60  # 60 seconds
+CONNECTION_LIMIT = 10
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# 多数据源配置
+CONF_FEEDS = "feeds"
+MAX_CONCURRENT_FEEDS = 3
+FEED_TIMEOUT_MARGIN = 5  # 在连接和读取超时之外额外留出的秒数
+FEED_RETRY_INTERVAL = 300  # 5 minutes，检查到期或失败的附加数据源
+MAX_FEED_ITEMS = 20
+
+# 性能分析服务
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+DEFAULT_PROFILE_DURATION = 60  # 60 seconds
+DATA_PROFILER = f"{DOMAIN}_profiler"
+
+# 跨日重复新闻检测
+DEDUP_DAYS = 7  # 与最近7天的新闻比较
+DEDUP_THRESHOLD = 0.63  # 单字Jaccard相似度阈值
+DEDUP_SAVE_DELAY = 10  # 10 seconds
+STORAGE_VERSION = 1
+STORAGE_KEY_TEMPLATE = DOMAIN + ".{}_headlines"
 
 # API地址模板
 API_URL_TEMPLATE = "https://qqlykm.cn/api/60s/index?key={}"
@@ -0,0 +1,178 @@
+"""Cross-day near-duplicate detection for Daily News integration."""
+import hashlib
+import random
+import re
+from datetime import datetime, timedelta
+
+from .const import DEDUP_DAYS, DEDUP_THRESHOLD
+
+# MinHash签名长度 = 分段数 × 每段行数，按段分桶（LSH）只比较候选项
+BANDS = 20
+ROWS = 3
+NUM_PERM = BANDS * ROWS
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# 固定种子，保证重启后签名一致
+_rng = random.Random(20251015)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+]
+
+_LEADING_NUMBER = re.compile(r"^\d+[、.]\s*")
+_NON_WORD = re.compile(r"[\W_]+")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+# 方向词按涨跌归类，较长的词放在前面优先匹配
+_DIRECTION = re.compile(r"上调|下调|加息|降息|涨|跌|升|降")
+_DIRECTION_UP = {"上调", "加息", "涨", "升"}
+_DATE_FORMAT = "%Y-%m-%d"
+
+
+def shingles(text):
+    """将标题转换为单字集合.
+
+    短标题改写时常增删词语，二元组会随之大量变化；单字集合在
+    60s新闻样本上对改写的容忍度最好。
+    """
+    return set(_NON_WORD.sub("", _LEADING_NUMBER.sub("", text).lower()))
+
+
+def facts(text):
+    """提取标题中的数字和涨跌方向.
+
+    行情、汇率、油价等新闻每天措辞几乎相同，只有数字或方向不同，
+    单字相似度无法区分，需要单独比较。
+    """
+    text = _LEADING_NUMBER.sub("", text)
+    numbers = frozenset(_NUMBER.findall(text))
+    directions = frozenset(
+        "up" if word in _DIRECTION_UP else "down" for word in _DIRECTION.findall(text)
+    )
+    return numbers, directions
+
+
+def same_facts(first, second):
+    """两条标题都包含数字（或方向）时，要求两者一致."""
+    for mine, other in zip(first, second):
+        if mine and other and mine != other:
+            return False
+    return True
+
+
+def minhash(shingle_set):
+    """计算MinHash签名，空集合返回None."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for shingle in shingle_set
+    ]
+    if not hashes:
+        return None
+    return [
+        min(((a * value + b) % _PRIME) & _MAX_HASH for value in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def jaccard(first, second):
+    """计算两个集合的Jaccard相似度."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def _band_keys(signature):
+    """生成签名的分段键."""
+    for band in range(BANDS):
+        yield (band, *signature[band * ROWS:(band + 1) * ROWS])
+
+
+def _parse_date(value):
+    """解析日期字符串，失败返回None."""
+    try:
+        return datetime.strptime(value, _DATE_FORMAT).date()
+    except (TypeError, ValueError):
+        return None
+
+
+class HeadlineIndex:
+    """最近N天标题的滚动索引.
+
+    MinHash分桶只用于找出候选标题，是否重复由精确的Jaccard相似度决定，
+    避免签名估算误差影响结果；相似的标题还需数字和涨跌方向一致才算重复。
+    """
+
+    def __init__(self, days: int = DEDUP_DAYS, threshold: float = DEDUP_THRESHOLD):
+        """Initialize."""
+        self.days = days
+        self.threshold = threshold
+        self._headlines = {}  # 日期 -> 标题列表
+        self._entries = {}  # 日期 -> [(单字集合, 数字与方向, 签名)]
+        self._buckets = {}  # 分段键 -> [(日期, 单字集合, 数字与方向)]
+
+    def load(self, data):
+        """从持久化数据恢复索引."""
+        headlines = (data or {}).get("headlines", {})
+        self._headlines = {}
+        self._entries = {}
+        for date, day in headlines.items():
+            self._add_day(date, day)
+        self._rebuild()
+
+    def as_dict(self):
+        """返回用于持久化的数据."""
+        return {"headlines": self._headlines}
+
+    def _add_day(self, date, headlines):
+        """记录某一天的标题及其签名."""
+        self._headlines[date] = []
+        self._entries[date] = []
+        for text in headlines:
+            shingle_set = shingles(text)
+            signature = minhash(shingle_set)
+            if signature is None:
+                continue
+            self._headlines[date].append(text)
+            self._entries[date].append((shingle_set, facts(text), signature))
+
+    def _rebuild(self):
+        """重建分桶."""
+        self._buckets = {}
+        for date, entries in self._entries.items():
+            for shingle_set, headline_facts, signature in entries:
+                for key in _band_keys(signature):
+                    self._buckets.setdefault(key, []).append((date, shingle_set, headline_facts))
+
+    def is_duplicate(self, text: str, date: str) -> bool:
+        """判断标题是否与其他日期的标题近似重复."""
+        shingle_set = shingles(text)
+        signature = minhash(shingle_set)
+        if signature is None:
+            return False
+
+        headline_facts = facts(text)
+        checked = set()
+        for key in _band_keys(signature):
+            for other_date, other, other_facts in self._buckets.get(key, ()):
+                # 同一天的数据可能被重复获取，不参与比较
+                if other_date == date or id(other) in checked:
+                    continue
+                checked.add(id(other))
+                if (
+                    jaccard(shingle_set, other) >= self.threshold
+                    and same_facts(headline_facts, other_facts)
+                ):
+                    return True
+        return False
+
+    def set_day(self, date: str, headlines):
+        """记录某一天的标题，并移除N天之前的数据."""
+        self._add_day(date, headlines)
+
+        today = _parse_date(date) or datetime.now().date()
+        oldest = today - timedelta(days=self.days)
+        for stored in list(self._headlines):
+            stored_date = _parse_date(stored)
+            if stored != date and (stored_date is None or stored_date < oldest):
+                del self._headlines[stored]
+                del self._entries[stored]
+        self._rebuild()
@@ -0,0 +1,73 @@
+"""Additional feeds for Daily News integration."""
+from .const import MAX_FEED_ITEMS
+
+# 可选的附加数据源（60s风格API）
+FEEDS = {
+    "history": {
+        "name": "历史上的今天",
+        "url": "https://60s.viki.moe/v2/today-in-history",
+        "scan_interval": 3600,  # 1 hour
+    },
+    "weibo": {
+        "name": "微博热搜",
+        "url": "https://60s.viki.moe/v2/weibo",
+        "scan_interval": 1800,  # 30 minutes
+    },
+    "zhihu": {
+        "name": "知乎热榜",
+        "url": "https://60s.viki.moe/v2/zhihu",
+        "scan_interval": 1800,  # 30 minutes
+    },
+    "baidu": {
+        "name": "百度热搜",
+        "url": "https://60s.viki.moe/v2/baidu/realtime",
+        "scan_interval": 1800,  # 30 minutes
+    },
+}
+
+
+class FeedError(Exception):
+    """数据源返回了无法解析的内容."""
+
+
+def _format_item(item):
+    """将单条数据转换为文本."""
+    if isinstance(item, str):
+        return item.strip()
+    if not isinstance(item, dict):
+        return str(item).strip()
+
+    title = str(item.get("title") or item.get("name") or item.get("content") or "").strip()
+    year = item.get("year")
+    if title and year:
+        return f"{year}年 {title}"
+    return title
+
+
+def parse_feed_items(payload):
+    """从60s风格的API响应中提取条目文本列表."""
+    if not isinstance(payload, dict):
+        raise FeedError("响应格式错误")
+
+    # 兼容 code=200 与 success=true 两种状态字段
+    if "code" in payload and payload["code"] != 200:
+        raise FeedError(f"返回状态码 {payload['code']}")
+    if "success" in payload and not payload["success"]:
+        raise FeedError("返回失败状态")
+
+    data = payload.get("data")
+    if isinstance(data, dict):
+        items = data.get("items") or data.get("news") or data.get("list") or []
+    elif isinstance(data, list):
+        items = data
+    else:
+        raise FeedError("缺少data字段")
+
+    texts = []
+    for item in items:
+        text = _format_item(item)
+        if text:
+            texts.append(text[:200])
+        if len(texts) >= MAX_FEED_ITEMS:
+            break
+    return texts
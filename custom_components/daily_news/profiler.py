@@ -0,0 +1,159 @@
+"""On-demand profiling for Daily News integration."""
+import asyncio
+import functools
+import json
+import logging
+import time
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# 协调器中需要统计的方法
+COORDINATOR_METHODS = (
+    "_async_update_data",
+    "_async_fetch_feeds",
+    "_process_data",
+    "_build_snapshot",
+    "_scroll_next",
+)
+
+
+class DailyNewsProfiler:
+    """在指定时长内统计关键函数的调用次数和累计耗时.
+
+    只在运行期间临时替换被统计的函数，停止后恢复原函数，
+    因此未开启时没有任何额外开销。
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinators, sensor_classes):
+        """Initialize."""
+        self.hass = hass
+        self.coordinators = list(coordinators)
+        self.sensor_classes = list(sensor_classes)
+        self.stats = {}
+        self.started = None
+        self._originals = []
+        self._cancel_stop = None
+
+    @property
+    def running(self):
+        """是否正在统计."""
+        return self.started is not None
+
+    def _record(self, name, elapsed):
+        """记录一次调用."""
+        entry = self.stats.setdefault(name, {"calls": 0, "cumulative": 0.0})
+        entry["calls"] += 1
+        entry["cumulative"] += elapsed
+
+    def _wrap(self, name, func):
+        """包装同步或异步函数以统计耗时."""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._record(name, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    @callback
+    def async_start(self, duration: int):
+        """开始统计，duration秒后自动停止并写入结果."""
+        self.stats = {}
+        self.started = time.perf_counter()
+
+        for coordinator in self.coordinators:
+            for method in COORDINATOR_METHODS:
+                original = getattr(coordinator, method)
+                setattr(coordinator, method, self._wrap(f"coordinator.{method}", original))
+                self._originals.append((coordinator, method))
+
+        for sensor_class in self.sensor_classes:
+            original = sensor_class.__dict__["extra_state_attributes"]
+            name = f"{sensor_class.__name__}.extra_state_attributes"
+            sensor_class.extra_state_attributes = property(self._wrap(name, original.fget))
+            self._originals.append((sensor_class, original))
+
+        self._cancel_stop = async_call_later(self.hass, duration, self._async_stop_later)
+        _LOGGER.info("性能分析已开启，持续%s秒", duration)
+
+    @callback
+    def _restore(self):
+        """恢复所有被替换的函数."""
+        for target, original in self._originals:
+            if isinstance(original, str):
+                # 协调器方法以实例属性覆盖，删除即可恢复
+                delattr(target, original)
+            else:
+                target.extra_state_attributes = original
+        self._originals = []
+
+    async def _async_stop_later(self, _now):
+        """定时器到期后停止统计."""
+        self._cancel_stop = None
+        await self.async_stop()
+
+    async def async_stop(self):
+        """停止统计并将结果写入配置目录."""
+        if not self.running:
+            return None
+
+        if self._cancel_stop:
+            self._cancel_stop()
+            self._cancel_stop = None
+
+        self._restore()
+        duration = time.perf_counter() - self.started
+        self.started = None
+
+        report = {
+            "duration": round(duration, 3),
+            "functions": {
+                name: {
+                    "calls": entry["calls"],
+                    "cumulative": round(entry["cumulative"], 6),
+                    "per_call": round(entry["cumulative"] / entry["calls"], 6),
+                }
+                for name, entry in sorted(
+                    self.stats.items(),
+                    key=lambda item: item[1]["cumulative"],
+                    reverse=True,
+                )
+            },
+        }
+
+        path = self.hass.config.path(
+            f"{DOMAIN}_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        await self.hass.async_add_executor_job(_write_report, path, report)
+
+        for name, entry in report["functions"].items():
+            _LOGGER.info(
+                "%s: 调用%s次，累计%.3f秒", name, entry["calls"], entry["cumulative"]
+            )
+        _LOGGER.info("性能分析已结束，结果已写入 %s", path)
+        return path
+
+
+def _write_report(path, report):
+    """写入统计结果（在执行器中运行）."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
@@ -60,6 +60,9 @@ class DailyNewsSensor(CoordinatorEntity, SensorEntity):
             "news": data.get("news", {}),
             "update_time": data.get("date", ""),
             "total_news": data.get("total_news", 0),
+            "new_news": data.get("new_news", {}),
+            "new_news_count": data.get("new_news_count", 0),
+            "feeds": data.get("feeds", {}),
             "scroll_interval": data.get("scroll_interval", 15),
             "last_update": data.get("last_update", "从未更新"),
             "update_schedule": data.get("update_schedule", "每日6点开始更新"),
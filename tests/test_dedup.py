@@ -0,0 +1,111 @@
+"""Tests for cross-day near-duplicate detection."""
+import pytest
+
+from custom_components.daily_news.dedup import HeadlineIndex
+
+# 改写后的同一条新闻
+DUPLICATES = [
+    ("国务院常务会议部署推进新型城镇化建设", "国常会部署推进新型城镇化建设工作"),
+    ("国家统计局：前三季度国内生产总值同比增长5.2%，经济运行总体回升向好", "国家统计局发布：前三季度GDP同比增长5.2%，经济运行总体回升向好"),
+    ("神舟二十号乘组顺利完成第三次出舱活动", "神舟二十号航天员乘组顺利完成第三次出舱活动任务"),
+    ("教育部：2026年全国硕士研究生招生考试报名将于10月开始", "教育部：2026年全国硕士研究生招生考试网上报名10月开始"),
+    ("中国气象局启动重大气象灾害（台风）四级应急响应", "中国气象局针对台风启动重大气象灾害四级应急响应"),
+    ("工信部：我国5G基站总数已超过400万个", "工信部发布数据，我国5G基站总数突破400万个"),
+    ("央行宣布下调存款准备金率0.5个百分点，释放长期资金约1万亿元", "央行下调存款准备金率0.5个百分点，预计释放长期流动性约1万亿元"),
+    ("交通运输部：国庆假期全社会跨区域人员流动量超22亿人次", "交通运输部：国庆假期全社会跨区域人员流动量累计超过22亿人次"),
+    ("我国成功发射天绘五号02组卫星，发射任务获得圆满成功", "天绘五号02组卫星成功发射，任务获得圆满成功"),
+    ("商务部：将对原产于美国的部分进口商品加征关税", "商务部宣布对原产于美国的部分进口商品加征关税"),
+    ("文旅部：中秋国庆假期国内旅游出游8.88亿人次", "文化和旅游部：中秋国庆假期国内出游8.88亿人次"),
+    ("外交部：中方坚决反对美方对台军售", "外交部回应：中方坚决反对美方售台武器"),
+    ("国家医保局：新版医保药品目录将于明年1月1日起正式实施", "国家医保局宣布新版国家医保药品目录明年1月1日起实施"),
+    ("特斯拉宣布在上海新建储能超级工厂", "特斯拉上海储能超级工厂宣布开工建设"),
+    ("日本首相石破茂宣布辞职", "日本首相石破茂宣布将辞去首相职务"),
+    ("美联储宣布降息25个基点，为年内首次降息", "美联储年内首次降息，下调利率25个基点"),
+    ("市场监管总局：今年以来查处食品安全违法案件15万件", "市场监管总局通报，今年以来共查处食品安全违法案件15万件"),
+    ("全国铁路国庆黄金周累计发送旅客1.9亿人次，创历史新高", "国庆黄金周全国铁路累计发送旅客1.9亿人次，创同期历史新高"),
+    ("华为发布新一代麒麟芯片", "华为正式发布新一代麒麟芯片"),
+    ("故宫博物院宣布周一闭馆调整为全年开放", "故宫博物院：周一闭馆调整，全年开放"),
+]
+
+# 措辞相近但内容不同的新闻
+UNRELATED = [
+    ("北京今日迎来降雪", "上海今日迎来降雨"),
+    ("神舟二十号乘组顺利完成第三次出舱活动", "国家统计局：前三季度国内生产总值同比增长5.2%"),
+    ("北京今日最高气温将达到25度，注意防晒", "上海今日最低气温将降至5度，注意保暖"),
+    ("国家统计局：9月CPI同比上涨0.4%", "国家统计局：9月PPI同比下降2.3%"),
+    ("我国成功发射天绘五号02组卫星", "我国成功发射遥感四十号03组卫星"),
+    ("外交部：中方坚决反对美方对台军售", "外交部：中方坚决反对日方排放核污染水"),
+    ("教育部：2026年全国硕士研究生招生考试报名将于10月开始", "教育部：2026年高考报名工作将于11月开始"),
+    ("工信部：我国5G基站总数已超过400万个", "工信部：我国光纤宽带用户已超过6亿户"),
+    ("交通运输部：国庆假期全社会跨区域人员流动量超22亿人次", "交通运输部：春运期间全社会跨区域人员流动量超90亿人次"),
+    ("中国气象局启动重大气象灾害（台风）四级应急响应", "应急管理部启动防汛四级应急响应"),
+    ("央行宣布下调存款准备金率0.5个百分点", "央行宣布下调7天逆回购利率0.1个百分点"),
+    ("商务部：将对原产于美国的部分进口商品加征关税", "商务部：将对原产于欧盟的进口白兰地实施反倾销措施"),
+    ("日本首相石破茂宣布辞职", "韩国总统尹锡悦宣布戒严"),
+    ("美联储宣布降息25个基点", "欧洲央行宣布降息25个基点"),
+    ("华为发布新一代麒麟芯片", "小米发布新一代澎湃芯片"),
+    ("全国铁路国庆黄金周累计发送旅客1.9亿人次", "全国民航国庆黄金周累计运送旅客1900万人次"),
+    ("国家医保局：新版医保药品目录将于明年1月1日起正式实施", "国家医保局：集采药品平均降价超50%"),
+    ("市场监管总局：今年以来查处食品安全违法案件15万件", "公安部：今年以来破获电信网络诈骗案件26万件"),
+    ("故宫博物院宣布周一闭馆调整为全年开放", "国家博物馆宣布延长开放时间"),
+    ("文旅部：中秋国庆假期国内旅游出游8.88亿人次", "文旅部：五一假期国内旅游出游3.14亿人次"),
+]
+
+# 每天重复出现、只有数字或涨跌方向不同的新闻
+RECURRING = [
+    ("A股三大指数集体收涨，沪指涨0.52%，深成指涨0.89%", "A股三大指数集体收跌，沪指跌0.35%，深成指跌0.61%"),
+    ("美联储宣布降息25个基点", "美联储宣布加息25个基点"),
+    ("国内油价今晚24时上调，92号汽油每升上涨0.08元", "国内油价今晚24时下调，92号汽油每升下降0.08元"),
+    ("离岸人民币兑美元汇率报7.1235", "离岸人民币兑美元汇率报7.1520"),
+]
+
+
+def _is_duplicate(yesterday, today):
+    """昨天出现过yesterday时，判断today是否重复."""
+    index = HeadlineIndex()
+    index.set_day("2025-10-14", [yesterday])
+    return index.is_duplicate(today, "2025-10-15")
+
+
+@pytest.mark.parametrize(("yesterday", "today"), DUPLICATES)
+def test_reworded_headline_is_duplicate(yesterday, today):
+    """改写后的标题应被识别为重复."""
+    assert _is_duplicate(yesterday, today)
+
+
+@pytest.mark.parametrize(("yesterday", "today"), UNRELATED + RECURRING)
+def test_different_headline_is_new(yesterday, today):
+    """内容不同，或只有数字、涨跌方向不同的标题不应被识别为重复."""
+    assert not _is_duplicate(yesterday, today)
+
+
+def test_same_day_is_ignored():
+    """同一天重复获取的数据不算重复."""
+    index = HeadlineIndex()
+    index.set_day("2025-10-15", ["国务院常务会议部署推进新型城镇化建设"])
+    assert not index.is_duplicate("国务院常务会议部署推进新型城镇化建设", "2025-10-15")
+
+
+def test_set_day_drops_headlines_older_than_window():
+    """超过7个自然日的数据会被移除，与中间缺失的天数无关."""
+    headline = "国务院常务会议部署推进新型城镇化建设"
+    index = HeadlineIndex(days=7)
+    index.set_day("2025-10-01", [headline])
+
+    index.set_day("2025-10-08", ["华为发布新一代麒麟芯片"])
+    assert index.is_duplicate(headline, "2025-10-08")
+
+    # 中间没有数据，只保留最近7天
+    index.set_day("2025-10-09", ["小米发布新一代澎湃芯片"])
+    assert not index.is_duplicate(headline, "2025-10-09")
+    assert set(index.as_dict()["headlines"]) == {"2025-10-08", "2025-10-09"}
+
+
+def test_load_restores_index():
+    """从持久化数据恢复后结果一致."""
+    index = HeadlineIndex()
+    index.set_day("2025-10-14", ["神舟二十号乘组顺利完成第三次出舱活动"])
+
+    restored = HeadlineIndex()
+    restored.load(index.as_dict())
+    assert restored.is_duplicate("神舟二十号航天员乘组顺利完成第三次出舱活动任务", "2025-10-15")